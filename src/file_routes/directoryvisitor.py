@@ -1,4 +1,5 @@
 import dataclasses
+import operator
 import os
 import re
 from typing import Iterator
@@ -12,14 +13,23 @@ from file_routes.inspection import (
 from file_routes.utils import route_contains_invalid_characters
 
 RE_WILDCARD = re.compile(r"\[((?P<converter>[^_]+)_|)(?P<name>[^]]+)]")
+# Every wildcard starts with this, checking it first avoids running the regex
+# for plain filenames, which are the vast majority of routes.
+_WILDCARD_PREFIX = "["
 
 
 @dataclasses.dataclass
 class DirectoryVisitor:
     framework: WebFramework
     extensions: list[str] = dataclasses.field(default_factory=lambda: ["py"])
+    warnings: list[CheckWarning] = dataclasses.field(default_factory=list)
+
+    def warning(self, message: str, code: str, hint: str | None = None) -> None:
+        self.warnings.append(CheckWarning(message, code, hint))
 
     def visit_and_analyze(self, directory: str) -> list[FileRouteAndView]:
+        # Only keep the warnings of the latest visit
+        self.warnings.clear()
         route_views = []
         for file_route in self.collect_routes_from_directory(
             directory, extensions=self.extensions
@@ -31,88 +41,96 @@ class DirectoryVisitor:
             ):
                 route_views.append(FileRouteAndView(file_route, view))
             else:
-                CheckWarning(
-                    f"Could not find a view in {file_route.name}",
+                self.warning(
+                    f"Could not find a view in {file_route.filename}",
                     hint="Create a view function called view or a class called View.",
                     code="fileroutes.W004",
                 )
+            self.warnings.extend(inspected_module.warnings)
 
         return route_views
 
     def expand_filename(self, filename: str) -> tuple[str, bool]:
-        was_transformed = False
-        if match := RE_WILDCARD.match(filename):
-            filename = self.framework.expand_wildcards(filename, match)
-            was_transformed = True
-        return filename, was_transformed
-
-    def directory_expand_converters(self, directory_route: str) -> str:
-        # foo/[slug]/bar -> foo/<slug:slug>/bar
-        if directory_route.startswith("/"):
-            directory_route = directory_route[1:]
-        parts = []
-        for part in directory_route.split(os.path.sep):
-            route, _ = self.expand_filename(part)
-            parts.append(route)
-        directory_route = os.path.join(*parts)
-        return directory_route
+        if not filename.startswith(_WILDCARD_PREFIX):
+            return filename, False
+        match = RE_WILDCARD.fullmatch(filename)
+        if match is None:
+            return filename, False
+        return self.framework.expand_wildcards(filename, match), True
 
     def collect_routes_from_directory(
         self, directory: str, extensions: list[str]
     ) -> Iterator[FileRouteInfo]:
-        for subdirectory, dirs, filenames in os.walk(directory):
-            if "__pycache__" in dirs:
-                dirs.remove("__pycache__")
-            relative = subdirectory[len(directory) :]
-            yield from self.visit_one_directory(
-                directory=subdirectory,
-                directory_route=self.directory_expand_converters(relative),
-                filenames=filenames,
-                extensions=extensions,
+        suffixes = tuple(f".{extension}" for extension in extensions)
+        yield from self.scan_directory(
+            directory=directory, route_prefix="", suffixes=suffixes
+        )
+
+    def scan_directory(
+        self, directory: str, route_prefix: str, suffixes: tuple[str, ...]
+    ) -> Iterator[FileRouteInfo]:
+        # route_prefix is already expanded, foo/[slug] -> foo/<slug:slug>/
+        subdirectories: list[os.DirEntry[str]] = []
+        files: list[os.DirEntry[str]] = []
+        try:
+            scandir_iterator = os.scandir(directory)
+        except OSError:
+            # Same as os.walk(), silently skip directories we cannot list
+            return
+        with scandir_iterator as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        subdirectories.append(entry)
+                elif entry.name.endswith(suffixes) and entry.is_file():
+                    files.append(entry)
+
+        yield from self.visit_one_directory(
+            route_prefix=route_prefix,
+            entries=files,
+        )
+        for subdirectory in subdirectories:
+            route, _ = self.expand_filename(subdirectory.name)
+            yield from self.scan_directory(
+                directory=subdirectory.path,
+                route_prefix=f"{route_prefix}{route}/",
+                suffixes=suffixes,
             )
 
     def visit_one_directory(
         self,
-        directory: str,
-        directory_route: str,
-        filenames: list[str],
-        extensions: list[str],
+        route_prefix: str,
+        entries: list[os.DirEntry[str]],
     ) -> Iterator[FileRouteInfo]:
-        normal_routes: list[FileRouteInfo] = []
-        wildcard_routes: list[FileRouteInfo] = []
-        for filename in filenames:
-            module_name, ext = filename.rsplit(".")
-            if ext not in extensions:
+        routes: list[FileRouteInfo] = []
+        for entry in entries:
+            filename = entry.name
+            module_name = filename.rpartition(".")[0]
+            if module_name == "__init__":
                 continue
             bad_chars = route_contains_invalid_characters(module_name)
             if bad_chars:
-                CheckWarning(
-                    f"{filename} contains invalid characters: {bad_chars}",
+                self.warning(
+                    f"{filename} contains invalid characters: "
+                    f"{', '.join(sorted(bad_chars))}",
                     hint="Some characters are not allowed on all supported platforms.",
                     code="fileroutes.W005",
                 )
 
-            if module_name == "__init__":
-                continue
-            elif module_name == "index":
-                route_name = directory_route
-                if directory_route != "":
-                    route_name += "/"
+            if module_name == "index":
+                route_name = route_prefix
                 is_wildcard = False
             else:
                 route_name, is_wildcard = self.expand_filename(module_name)
-                if directory_route:
-                    route_name = directory_route + "/" + route_name
-            if is_wildcard:
-                routes = wildcard_routes
-            else:
-                routes = normal_routes
+                route_name = route_prefix + route_name
             routes.append(
                 FileRouteInfo(
                     name=route_name,
-                    filename=os.path.join(directory, filename),
+                    filename=entry.path,
                     is_wildcard=is_wildcard,
                 )
             )
-        yield from normal_routes
-        yield from wildcard_routes
+        # Wildcards must come last so they do not shadow normal routes, the
+        # sort is stable so the directory order is otherwise kept.
+        routes.sort(key=operator.attrgetter("is_wildcard"))
+        yield from routes
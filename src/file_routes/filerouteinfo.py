@@ -8,8 +8,14 @@ from file_routes.inspection import InspectedModuleInfo
 
 ViewFuncOrClass = Any
 
+# Names looked up in a route module, in order of preference. These are built
+# once and, being identifier literals, already interned by the compiler just
+# like the keys of a module __dict__, so lookups compare by identity.
+VIEW_FUNCTION_NAMES = ("view",)
+VIEW_CLASS_NAMES = ("View",)
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class FileRouteInfo:
     # The filename of this route
     filename: str
@@ -1,27 +1,34 @@
 import re
-from typing import Any, Sequence, cast
-
-from django.conf import settings
-from django.urls import URLPattern, URLResolver, include, path
-from django.urls.converters import get_converters
-from django.views import View
+from typing import TYPE_CHECKING, Any, Sequence, cast
 
 from file_routes.directoryvisitor import DirectoryVisitor
-from file_routes.filerouteinfo import FileRouteInfo, WebFramework
-from file_routes.inspection import InspectedModuleInfo
+from file_routes.filerouteinfo import (
+    VIEW_CLASS_NAMES,
+    VIEW_FUNCTION_NAMES,
+    FileRouteInfo,
+    WebFramework,
+)
+from file_routes.inspection import InspectedModuleInfo, log_warnings
+from file_routes.route import ROUTE_KWARGS_ATTRIBUTE, ROUTE_NAME_ATTRIBUTE
+
+# Django is imported where it is used, importing this module should not pull
+# in the URL resolver machinery until routes are actually discovered.
+if TYPE_CHECKING:
+    from django.urls import URLPattern, URLResolver
 
 ViewFunc = Any
-PathType = tuple[Sequence[URLResolver | URLPattern], str | None, str | None]
-_ALL_CONVERTERS = get_converters().keys()
+PathType = tuple[Sequence["URLResolver | URLPattern"], str | None, str | None]
 
 
 class DjangoWebFramework(WebFramework):
     def expand_wildcards(self, filename: str, match: re.Match[str]) -> str:
+        from django.urls.converters import get_converters
+
         # [slug] -> <slug:slug>
         # [slug_customer] -> <slug:customer>
-        _, converter, name = match.groups()
+        converter, name = match.group("converter", "name")
         if converter is None:
-            if name in _ALL_CONVERTERS:
+            if name in get_converters():
                 converter = name
             else:
                 converter = "str"
@@ -30,30 +37,38 @@ class DjangoWebFramework(WebFramework):
     def analyze(
         self, file_route: FileRouteInfo, inspected_module: InspectedModuleInfo
     ) -> ViewFunc | None:
-        if function_view := inspected_module.find_function_by_name(["view"]):
+        from django.views import View
+
+        if function_view := inspected_module.find_function_by_name(VIEW_FUNCTION_NAMES):
             return function_view
         if class_view := inspected_module.find_class_by_name(
-            ["View"], issubclass_of=View
+            VIEW_CLASS_NAMES, issubclass_of=View
         ):
             return class_view.as_view()
         return None
 
 
 def autodiscover(directory: str | None = None) -> PathType:
+    from django.conf import settings
+    from django.urls import include, path
+
     if directory is None:
         directory = getattr(settings, "FILE_ROUTES_DIRECTORY", "routes")
     directory_visitor = DirectoryVisitor(framework=DjangoWebFramework())
 
-    routes = []
-    for file_route, view_func in directory_visitor.visit_and_analyze(
-        directory=directory
-    ):
-        routes.append(
-            path(
-                route=file_route.name,
-                view=view_func,
-                kwargs=getattr(view_func, "route_kwargs", {}),
-                name=cast(str, getattr(view_func, "route_name", None)),
-            )
+    routes = [
+        path(
+            route=file_route.name,
+            view=view_func,
+            kwargs=getattr(view_func, ROUTE_KWARGS_ATTRIBUTE, {}),
+            name=cast(str, getattr(view_func, ROUTE_NAME_ATTRIBUTE, None)),
+        )
+        for file_route, view_func in directory_visitor.visit_and_analyze(
+            directory=directory
         )
+    ]
+    log_warnings(
+        directory_visitor.warnings,
+        silenced=getattr(settings, "SILENCED_SYSTEM_CHECKS", []),
+    )
     return include(routes)
@@ -4,15 +4,23 @@ from flask import Flask
 from flask.views import View
 
 from file_routes.directoryvisitor import DirectoryVisitor
-from file_routes.filerouteinfo import FileRouteInfo, ViewFuncOrClass, WebFramework
-from file_routes.inspection import InspectedModuleInfo
+from file_routes.filerouteinfo import (
+    VIEW_CLASS_NAMES,
+    VIEW_FUNCTION_NAMES,
+    FileRouteInfo,
+    ViewFuncOrClass,
+    WebFramework,
+)
+from file_routes.inspection import InspectedModuleInfo, log_warnings
+
+_FLASK_CONVERTERS = frozenset({"int", "float", "path", "string", "uuid"})
 
 
 class FlaskWebFramework(WebFramework):
     def expand_wildcards(self, filename: str, match: re.Match[str]) -> str:
-        _, converter, name = match.groups()
+        converter, name = match.group("converter", "name")
         if converter is None:
-            if name in ["int", "float", "path", "string", "uuid"]:
+            if name in _FLASK_CONVERTERS:
                 converter = name
             else:
                 converter = "string"
@@ -21,13 +29,16 @@ class FlaskWebFramework(WebFramework):
     def analyze(
         self, file_route: FileRouteInfo, inspected_module: InspectedModuleInfo
     ) -> ViewFuncOrClass | None:
-        if function_view := inspected_module.find_function_by_name(["view"]):
+        if function_view := inspected_module.find_function_by_name(VIEW_FUNCTION_NAMES):
             return function_view
         if class_view := inspected_module.find_class_by_name(
-            ["View"], issubclass_of=View
+            VIEW_CLASS_NAMES, issubclass_of=View
         ):
             route_name = inspected_module.get_attribute_by_type(
-                "route_name", str, default=file_route.name
+                "route_name",
+                str,
+                default=file_route.name,
+                code="fileroutes.W007",
             )
             return class_view.as_view(route_name)
         return None
@@ -37,6 +48,7 @@ class FlaskFSRoutes:
     def init_app(self, app: Flask) -> None:
         manager = DirectoryVisitor(framework=FlaskWebFramework())
         route_views = manager.visit_and_analyze(app.config["FS_ROUTES_DIRECTORY"])
+        log_warnings(manager.warnings)
         for i, (file_route, view_func) in enumerate(route_views, start=1):
             # XXX: defaults
             # XXX: subdomain
@@ -1,10 +1,21 @@
 import dataclasses
 import importlib
 import importlib.util
-import inspect
+import logging
+import os
 import sys
-from types import FunctionType, ModuleType
-from typing import Any, Protocol, TypeVar, cast, overload
+from types import FunctionType, MappingProxyType, ModuleType
+from typing import (
+    Any,
+    Collection,
+    Iterable,
+    Mapping,
+    Protocol,
+    Sequence,
+    TypeVar,
+    cast,
+    overload,
+)
 
 
 class DjangoView(Protocol):
@@ -18,34 +29,59 @@ class FlaskView(Protocol):
 
 
 T = TypeVar("T", str, DjangoView, FlaskView)
+# Both separators, filenames on Windows may contain either
+_MODULE_PATH_TABLE = str.maketrans({"/": ".", "\\": "."})
+# filename -> (st_mtime_ns, module) of the last import
+_IMPORT_CACHE: dict[str, tuple[int, ModuleType]] = {}
+logger = logging.getLogger("file_routes")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CheckWarning:
     message: str
     code: str
     hint: str | None = None
 
+    def __str__(self) -> str:
+        # Same layout as a Django system check
+        text = f"({self.code}) {self.message}"
+        if self.hint is not None:
+            text += f"\n\tHINT: {self.hint}"
+        return text
 
-@dataclasses.dataclass
+
+def log_warnings(
+    warnings: Iterable[CheckWarning], silenced: Collection[str] = ()
+) -> None:
+    for warning in warnings:
+        if warning.code not in silenced:
+            logger.warning("%s", warning)
+
+
+@dataclasses.dataclass(slots=True)
 class InspectedModuleInfo:
     module: ModuleType
-    attributes: dict[str, Any]
     warnings: list[CheckWarning] = dataclasses.field(default_factory=list)
 
     @property
     def name(self) -> str:
         return self.module.__name__
 
+    @property
+    def attributes(self) -> Mapping[str, Any]:
+        # Read-only, changes would otherwise end up in the route module
+        return MappingProxyType(vars(self.module))
+
     def warning(self, message: str, code: str, hint: str | None = None) -> None:
         self.warnings.append(CheckWarning(message, code, hint))
 
-    def find_function_by_name(self, candidates: list[str]) -> FunctionType | None:
+    def find_function_by_name(self, candidates: Sequence[str]) -> FunctionType | None:
+        namespace = vars(self.module)
         for candidate in candidates:
-            function = self.attributes.get(candidate)
+            function = namespace.get(candidate)
             if function is None:
                 continue
-            if not inspect.isfunction(function):
+            if not isinstance(function, FunctionType):
                 self.warning(
                     f"{candidate} in {self.name} is not a function",
                     code="fileroutes.W001",
@@ -59,14 +95,15 @@ class InspectedModuleInfo:
         return None
 
     def find_class_by_name(
-        self, candidates: list[str], issubclass_of: type[T] | None = None
+        self, candidates: Sequence[str], issubclass_of: type[T] | None = None
     ) -> T | None:
+        namespace = vars(self.module)
         for candidate in candidates:
-            class_ = cast(T | None, self.attributes.get(candidate))
+            class_ = cast(T | None, namespace.get(candidate))
             if class_ is None:
                 continue
             # FIXME: Should this be a warning?
-            if not inspect.isclass(class_):
+            if not isinstance(class_, type):
                 self.warning(
                     f"{candidate} in {self.name} is not a class",
                     hint=(
@@ -77,8 +114,6 @@ class InspectedModuleInfo:
                 )
                 continue
             if issubclass_of is not None:
-                if class_ == issubclass_of:
-                    continue
                 if not issubclass(class_, issubclass_of):
                     self.warning(
                         f"{candidate} in {self.name} is not a subclass "
@@ -87,50 +122,83 @@ class InspectedModuleInfo:
                         code="fileroutes.W003",
                     )
                     continue
+                # The base class itself, e.g. from django.views import View
+                if class_ is issubclass_of:
+                    continue
 
             return class_
         return None
 
     @overload
     def get_attribute_by_type(
-        self, attribute: str, attribute_type: type[T], default: T
+        self,
+        attribute: str,
+        attribute_type: type[T],
+        default: T,
+        *,
+        code: str = "fileroutes.W006",
     ) -> T:
         ...
 
     @overload
     def get_attribute_by_type(
-        self, attribute: str, attribute_type: type[T], default: None
+        self,
+        attribute: str,
+        attribute_type: type[T],
+        default: None = None,
+        *,
+        code: str = "fileroutes.W006",
     ) -> T | None:
         ...
 
     def get_attribute_by_type(
-        self, attribute: str, attribute_type: type[T], default: T | None = None
+        self,
+        attribute: str,
+        attribute_type: type[T],
+        default: T | None = None,
+        *,
+        code: str = "fileroutes.W006",
     ) -> T | None:
-        route_kwargs = getattr(self.module, attribute, default)
-        if not isinstance(route_kwargs, attribute_type):
-            CheckWarning(
-                f"{self.name}.{attribute} must be a {attribute_type}, "
-                f"not {type(route_kwargs).__name__}",
-                hint=f"Change {attribute} to be a {attribute_type}.",
-                code="fileroutes.W006",
+        value = getattr(self.module, attribute, default)
+        # type() is a cheaper check for the common exact match, e.g. a str
+        if value is default or type(value) is attribute_type:
+            return cast(T | None, value)
+        if not isinstance(value, attribute_type):
+            self.warning(
+                f"{self.name}.{attribute} must be a {attribute_type.__name__}, "
+                f"not {type(value).__name__}",
+                hint=f"Change {attribute} to be a {attribute_type.__name__}.",
+                code=code,
             )
-            route_kwargs = default
-        return route_kwargs
+            value = default
+        return value
 
 
 def inspect_module(module: ModuleType) -> InspectedModuleInfo:
-    attributes = {}
-    for name, value in inspect.getmembers(module):
-        attributes[name] = value
-    return InspectedModuleInfo(module=module, attributes=attributes)
+    return InspectedModuleInfo(module=module)
 
 
 def filename_to_module_path(filename: str) -> str:
     # foo/bar/baz.py -> foo.bar.baz
-    return filename[:-3].replace("/", ".")
+    return filename.removesuffix(".py").translate(_MODULE_PATH_TABLE)
 
 
 def import_filename_and_guess_module_from_path(filename: str) -> ModuleType:
+    # Rescanning a routes directory should not execute unchanged files again,
+    # the modification time is compared so edited files are reloaded.
+    # sys.modules is deliberately not consulted, it still holds the previous
+    # version of an edited file, or an unrelated module with the same name.
+    mtime_ns = os.stat(filename).st_mtime_ns
+    cached = _IMPORT_CACHE.get(filename)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    module = import_module_from_file(filename)
+    # Replaces the entry of an edited file, so old versions can be freed
+    _IMPORT_CACHE[filename] = (mtime_ns, module)
+    return module
+
+
+def import_module_from_file(filename: str) -> ModuleType:
     module_name = filename_to_module_path(filename)
     spec = importlib.util.spec_from_file_location(module_name, filename)
     assert spec is not None
@@ -1,20 +1,21 @@
-from functools import wraps
 from typing import Any, Callable, ParamSpec, TypeVar
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Attributes holding the route options on a view function
+ROUTE_NAME_ATTRIBUTE = "route_name"
+ROUTE_KWARGS_ATTRIBUTE = "route_kwargs"
+
 
 def route(
     name: str | None = None,
     default: dict[str, Any] | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    # The view is returned as is, the options are read back by autodiscover()
     def decorator(function: Callable[P, T]) -> Callable[P, T]:
-        @wraps(function)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            result = function(*args, **kwargs)
-            return result
-
-        return wrapper
+        setattr(function, ROUTE_NAME_ATTRIBUTE, name)
+        setattr(function, ROUTE_KWARGS_ATTRIBUTE, default or {})
+        return function
 
     return decorator
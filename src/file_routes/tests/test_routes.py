@@ -1,18 +1,36 @@
 import dataclasses
 import enum
+import functools
+import importlib
+import os
 import pathlib
+import re
+import sys
 import textwrap
+import typing
 from typing import Any
 
 import pytest
 from django.test import Client
-from django.urls import URLResolver, path
+from django.urls import (
+    URLPattern,
+    URLResolver,
+    converters,
+    path,
+    register_converter,
+    reverse,
+)
 from flask import Flask
 
 from file_routes.directoryvisitor import DirectoryVisitor
-from file_routes.filerouteinfo import WebFramework
-from file_routes.frameworks.django import DjangoWebFramework, autodiscover
-from file_routes.frameworks.flask import FlaskFSRoutes, FlaskWebFramework
+from file_routes.frameworks.django import DjangoWebFramework, PathType, autodiscover
+from file_routes.frameworks.flask import FlaskFSRoutes
+from file_routes.inspection import (
+    filename_to_module_path,
+    import_filename_and_guess_module_from_path,
+    inspect_module,
+)
+from file_routes.utils import route_contains_invalid_characters
 
 
 class ViewType(enum.StrEnum):
@@ -28,15 +46,16 @@ class FrameworkType(enum.StrEnum):
 ParameterName = str
 ParameterType = str  # int/path/slug/uuid
 urlpatterns: list[URLResolver] = []
+RE_URL_WILDCARD = re.compile(r"\[([^]]+)]")
 
 
+@functools.lru_cache(maxsize=None)
 def get_view_template(framework_type: FrameworkType, view_type: ViewType) -> str:
-    template = ""
+    parts: list[str] = []
     indent = 0
 
     def write(text: str = "") -> None:
-        nonlocal template
-        template += textwrap.indent(text + "\n", " " * (indent * 4))
+        parts.append(" " * (indent * 4) + text + "\n" if text else "\n")
 
     if framework_type == FrameworkType.DJANGO:
         write("from typing import Self")
@@ -77,7 +96,7 @@ def get_view_template(framework_type: FrameworkType, view_type: ViewType) -> str
         write("}}\n")
     else:
         raise NotImplementedError(framework_type)
-    return template
+    return "".join(parts)
 
 
 @dataclasses.dataclass
@@ -95,29 +114,24 @@ class View:
         self.tests = tests
 
 
-def parse_url(
-    visitor: DirectoryVisitor, url: str
-) -> dict[ParameterName, ParameterType]:
+def parse_url(url: str) -> dict[ParameterName, ParameterType]:
+    # /blog/[int_year]/[slug] -> {"year": "int", "slug": "str"}
     params = {}
-    for part in url.split("/"):
-        visitor.expand_filename(part)
-        filename, is_wildcard = visitor.expand_filename(part)
-        if not is_wildcard:
-            continue
-        parameter_type, parameter_name = filename[1:-1].split(":")
-        if parameter_type != "int":
-            parameter_type = "str"
-        params[parameter_name] = parameter_type
+    for match in RE_URL_WILDCARD.finditer(url):
+        converter, _, parameter_name = match.group(1).partition("_")
+        if not parameter_name:
+            # [int] is both the converter and the parameter name
+            parameter_name = converter
+        params[parameter_name] = "int" if converter == "int" else "str"
     return params
 
 
 def generate_view_source(
-    visitor: DirectoryVisitor,
     framework_type: FrameworkType,
     view_type: ViewType,
     url: str,
 ) -> str:
-    groups = parse_url(visitor=visitor, url=url)
+    groups = parse_url(url=url)
     response_params = [f'"{pname}": {pname}' for pname in groups.keys()]
     params = [f"{pname}: {ptype}" for pname, ptype in groups.items()]
     if view_type == ViewType.CLASS:
@@ -203,24 +217,12 @@ def test_routes(
     view_type: ViewType,
     flask_app: Flask,
 ) -> None:
-    framework: WebFramework
     root = tmp_path / "routes"
-    if framework_type == FrameworkType.DJANGO:
-        framework = DjangoWebFramework()
-    elif framework_type == FrameworkType.FLASK:
-        framework = FlaskWebFramework()
-        flask_app.config["FS_ROUTES_DIRECTORY"] = str(root)
-        FlaskFSRoutes().init_app(flask_app)
-    else:
-        raise NotImplementedError(framework_type)
-
-    visitor = DirectoryVisitor(framework=framework)
     for view_path in view.paths:
         full = root / (str(pathlib.Path(*view_path.parts[1:])) + ".py")
         full.parent.mkdir(parents=True, exist_ok=True)
         full.write_text(
             generate_view_source(
-                visitor,
                 framework_type=framework_type,
                 url=str(view_path),
                 view_type=view_type,
@@ -251,3 +253,220 @@ def test_routes(
         assert body["method"] == test.method
         assert body["params"] == test.params
         assert body["path"] == test.url
+
+
+def test_import_is_cached_until_modified(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "page.py"
+    filename.write_text("value = 1\n")
+    module = import_filename_and_guess_module_from_path(str(filename))
+    assert import_filename_and_guess_module_from_path(str(filename)) is module
+
+    filename.write_text("value = 2\n")
+    mtime_ns = filename.stat().st_mtime_ns + 1_000_000_000
+    os.utime(filename, ns=(mtime_ns, mtime_ns))
+    reloaded = import_filename_and_guess_module_from_path(str(filename))
+    assert reloaded is not module
+    assert reloaded.value == 2
+
+
+def test_collect_routes_skips_other_files(tmp_path: pathlib.Path) -> None:
+    for filename in ["home.py", "__init__.py", "README.md", "Makefile", "home.pyc"]:
+        (tmp_path / filename).write_text("")
+    visitor = DirectoryVisitor(framework=DjangoWebFramework())
+    routes = visitor.collect_routes_from_directory(str(tmp_path), extensions=["py"])
+    assert [route.name for route in routes] == ["home"]
+
+
+def test_autodiscover_type_hints() -> None:
+    assert autodiscover.__annotations__["return"] is PathType
+    # The Django URL types are only imported for type checking
+    django_types = {"URLPattern": URLPattern, "URLResolver": URLResolver}
+    hints = typing.get_type_hints(autodiscover, localns=django_types)
+    assert typing.get_args(hints["return"]) == (
+        typing.Sequence[URLResolver | URLPattern],
+        str | None,
+        str | None,
+    )
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("home", ("home", False)),
+        ("[slug]", ("<slug:slug>", True)),
+        ("[int_year]", ("<int:year>", True)),
+        ("[username]", ("<str:username>", True)),
+        ("[slug]-suffix", ("[slug]-suffix", False)),
+    ],
+)
+def test_expand_filename(filename: str, expected: tuple[str, bool]) -> None:
+    visitor = DirectoryVisitor(framework=DjangoWebFramework())
+    assert visitor.expand_filename(filename) == expected
+
+
+def test_expand_filename_registered_converter() -> None:
+    visitor = DirectoryVisitor(framework=DjangoWebFramework())
+    assert visitor.expand_filename("[year]") == ("<str:year>", True)
+    register_converter(converters.IntConverter, "year")
+    try:
+        assert visitor.expand_filename("[year]") == ("<year:year>", True)
+    finally:
+        del converters.REGISTERED_CONVERTERS["year"]
+        converters.get_converters.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["routes/blog/index.py", "routes\\blog\\index.py", "routes/blog\\index.py"],
+)
+def test_filename_to_module_path(filename: str) -> None:
+    assert filename_to_module_path(filename) == "routes.blog.index"
+
+
+@pytest.mark.parametrize(
+    "module_name, expected",
+    [("index", set()), ("with-hyphen", set()), ("a<b|c", {"<", "|"})],
+)
+def test_route_contains_invalid_characters(
+    module_name: str, expected: set[str]
+) -> None:
+    assert route_contains_invalid_characters(module_name) == expected
+
+
+@pytest.mark.urls(__name__)
+def test_route_decorator(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "page.py").write_text(
+        textwrap.dedent(
+            """
+            from django.http import JsonResponse
+            from file_routes.route import route
+
+            @route(name="page", default={"extra": 1})
+            def view(request, extra):
+                return JsonResponse({"extra": extra})
+            """
+        )
+    )
+    urlpatterns[:] = [path("", autodiscover(str(tmp_path)))]
+    assert reverse("page") == "/page"
+    assert Client().get("/page").json() == {"extra": 1}
+
+
+def test_get_attribute_by_type(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "page.py"
+    filename.write_text('title = "Page"\nroute_name = 1\n')
+    inspected_module = inspect_module(
+        import_filename_and_guess_module_from_path(str(filename))
+    )
+    assert inspected_module.get_attribute_by_type("title", str) == "Page"
+    assert inspected_module.get_attribute_by_type("missing", str) is None
+    assert inspected_module.get_attribute_by_type("missing", str, "x") == "x"
+    assert inspected_module.warnings == []
+    assert (
+        inspected_module.get_attribute_by_type(
+            "route_name", str, "x", code="fileroutes.W007"
+        )
+        == "x"
+    )
+    [warning] = inspected_module.warnings
+    assert warning.code == "fileroutes.W007"
+    assert (
+        warning.message == f"{inspected_module.name}.route_name must be a str, not int"
+    )
+    assert warning.hint == "Change route_name to be a str."
+
+
+@pytest.mark.urls(__name__)
+def test_imported_base_view_is_not_a_view(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "page.py").write_text("from django.views import View\n")
+    urlpatterns[:] = [path("", autodiscover(str(tmp_path)))]
+    assert Client().get("/page").status_code == 404
+
+
+def test_visitor_collects_warnings(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "empty.py").write_text("")
+    (tmp_path / "not-a-function.py").write_text("view = 1\n")
+    visitor = DirectoryVisitor(framework=DjangoWebFramework())
+    for _ in range(2):
+        assert visitor.visit_and_analyze(str(tmp_path)) == []
+        assert sorted(w.code for w in visitor.warnings) == [
+            "fileroutes.W001",
+            "fileroutes.W004",
+            "fileroutes.W004",
+        ]
+
+
+def test_autodiscover_logs_warnings(
+    tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture, settings: Any
+) -> None:
+    (tmp_path / "empty.py").write_text("")
+    (tmp_path / "not-a-function.py").write_text("view = 1\n")
+    settings.SILENCED_SYSTEM_CHECKS = ["fileroutes.W001"]
+    with caplog.at_level("WARNING", logger="file_routes"):
+        autodiscover(str(tmp_path))
+    assert [record.getMessage().split(")")[0] for record in caplog.records] == [
+        "(fileroutes.W004",
+        "(fileroutes.W004",
+    ]
+
+
+def test_flask_init_app_logs_warnings(
+    tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture, flask_app: Flask
+) -> None:
+    # The root index has an empty route name, so the file must be named
+    for name in ["index", "empty"]:
+        (tmp_path / f"{name}.py").write_text("")
+    flask_app.config["FS_ROUTES_DIRECTORY"] = str(tmp_path)
+    with caplog.at_level("WARNING", logger="file_routes"):
+        FlaskFSRoutes().init_app(flask_app)
+    assert sorted(caplog.messages) == [
+        f"(fileroutes.W004) Could not find a view in {tmp_path / name}.py\n"
+        "\tHINT: Create a view function called view or a class called View."
+        for name in ["empty", "index"]
+    ]
+
+
+def test_routes_can_import_the_discovering_module(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # urls.py runs discovery while it is being imported and the routes import
+    # it back, this must not deadlock on the module import lock.
+    routes = tmp_path / "routes"
+    routes.mkdir()
+    for name in ["a", "b"]:
+        (routes / f"{name}.py").write_text(
+            "from discovering.urls import SITE_NAME\n\n"
+            "def view(request):\n"
+            "    return SITE_NAME\n"
+        )
+    (tmp_path / "discovering").mkdir()
+    (tmp_path / "discovering" / "__init__.py").write_text("")
+    (tmp_path / "discovering" / "urls.py").write_text(
+        textwrap.dedent(
+            f"""
+            from file_routes.directoryvisitor import DirectoryVisitor
+            from file_routes.frameworks.django import DjangoWebFramework
+
+            SITE_NAME = "site"
+            ROUTES = DirectoryVisitor(framework=DjangoWebFramework()).visit_and_analyze(
+                {str(routes)!r}
+            )
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        urls = importlib.import_module("discovering.urls")
+    finally:
+        sys.modules.pop("discovering.urls", None)
+        sys.modules.pop("discovering", None)
+    assert sorted(route.name for route, _ in urls.ROUTES) == ["a", "b"]
+
+
+def test_invalid_characters_warning(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "a|b<c.py").write_text("")
+    visitor = DirectoryVisitor(framework=DjangoWebFramework())
+    list(visitor.collect_routes_from_directory(str(tmp_path), extensions=["py"]))
+    assert [w.message for w in visitor.warnings] == [
+        "a|b<c.py contains invalid characters: <, |"
+    ]
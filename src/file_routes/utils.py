@@ -1,19 +1,26 @@
 # https://stackoverflow.com/q/1976007
-FORBIDDEN_FILENAME_CHARS = {
-    "<",  # less than
-    ">",  # greater than
-    ":",  # colon - sometimes works, but is actually NTFS Alternate Data Streams
-    '"',  # double quote
-    "/",  # forward slash
-    "\\",  # backslash
-    "|",  # vertical bar or pipe
-    "?",  # question mark
-    "*",  # asterisk
-}
+FORBIDDEN_FILENAME_CHARS = frozenset(
+    {
+        "<",  # less than
+        ">",  # greater than
+        ":",  # colon - sometimes works, but is actually NTFS Alternate Data Streams
+        '"',  # double quote
+        "/",  # forward slash
+        "\\",  # backslash
+        "|",  # vertical bar or pipe
+        "?",  # question mark
+        "*",  # asterisk
+    }
+)
+_FORBIDDEN_TABLE = str.maketrans("", "", "".join(FORBIDDEN_FILENAME_CHARS))
 
 
-def route_contains_invalid_characters(module_name: str) -> set[str]:
-    return set(module_name) - FORBIDDEN_FILENAME_CHARS
+def route_contains_invalid_characters(module_name: str) -> frozenset[str]:
+    # Deleting the forbidden characters is a single scan in C, only collect
+    # them when the length changed, which is rarely the case.
+    if len(module_name.translate(_FORBIDDEN_TABLE)) == len(module_name):
+        return frozenset()
+    return FORBIDDEN_FILENAME_CHARS.intersection(module_name)
 
 
 def underscore_to_camel_case(word: str) -> str: